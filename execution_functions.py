@@ -1,8 +1,56 @@
+import functools
 import json
+import os
 import subprocess
-import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List
+from typing import Callable, Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:  # optional speedup, fall back to simdjson or json
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:  # optional speedup, fall back to the standard library
+    simdjson = None
+
+# simdjson parsers own a reusable buffer but must not be shared between
+# threads (run_batch parses from several threads), so keep one per thread
+_simdjson_local = threading.local()
+
+
+def _parse_json(stdout: bytes) -> Dict:
+    """Parse JSON bytes, using orjson or simdjson when they are installed."""
+    if orjson is not None:
+        return orjson.loads(stdout)
+    if simdjson is not None:
+        parser = getattr(_simdjson_local, "parser", None)
+        if parser is None:
+            parser = _simdjson_local.parser = simdjson.Parser()
+        # Materialize right away: the parser reuses its buffer on the next call
+        return parser.parse(stdout).as_dict()
+    return json.loads(stdout)
+
+
+@functools.lru_cache(maxsize=None)
+def _check_executable(executable_path: str) -> None:
+    """
+    Check that the executable exists.
+
+    Only successful checks are cached, so a missing executable is looked up
+    again on the next call (e.g. after building the project).
+
+    Raises:
+        FileNotFoundError: If executable doesn't exist
+    """
+    if not os.path.exists(executable_path):
+        raise FileNotFoundError(
+            f"Executable not found at {executable_path}. "
+            "Please build the project first with 'cd build && cmake .. && make'"
+        )
 
 
 def _run_command(command: List[str]) -> Dict:
@@ -20,21 +68,17 @@ def _run_command(command: List[str]) -> Dict:
         RuntimeError: If command fails with non-zero return code
         ValueError: If output is empty or invalid JSON
     """
-    executable_path = Path(command[0])
-
-    # Check if executable exists
-    if not executable_path.exists():
-        raise FileNotFoundError(
-            f"Executable not found at {executable_path}. "
-            "Please build the project first with 'cd build && cmake .. && make'"
-        )
+    _check_executable(command[0])
 
-    # Use Popen to stream stderr in real-time while capturing stdout
+    # Use Popen to stream stderr in real-time while capturing stdout.
+    # stderr is inherited (Jupyter forwards fd 2 to the notebook) and fds are
+    # not closed explicitly; this lets CPython launch the child with
+    # posix_spawn instead of fork + exec. Python's own fds are non-inheritable
+    # by default, so nothing leaks into the child.
     process = subprocess.Popen(
         command,
         stdout=subprocess.PIPE,
-        stderr=sys.stderr,  # Stream stderr directly to notebook in real-time
-        text=True,
+        close_fds=False,
     )
 
     # Wait for process to complete and capture stdout
@@ -56,17 +100,27 @@ def _run_command(command: List[str]) -> Dict:
 
     # Parse and return JSON
     try:
-        return json.loads(stdout)
-    except json.JSONDecodeError as e:
+        return _parse_json(stdout)
+    except ValueError as e:
         raise ValueError(
-            f"Failed to parse JSON output.\nStdout: {stdout[:200]}\nJSON Error: {e}"
+            "Failed to parse JSON output.\n"
+            f"Stdout: {stdout[:200].decode(errors='replace')}\n"
+            f"JSON Error: {e}"
         ) from e
 
 
-def _get_executable_path() -> Path:
-    """Get the path to the matroid_intersection executable."""
-    project_root = Path(__file__).parent
-    return project_root / "build" / "matroid_intersection"
+_EXECUTABLE_PATH = Path(__file__).parent / "build" / "matroid_intersection"
+_EXECUTABLE_STR = str(_EXECUTABLE_PATH)
+
+
+def _build_command(subcommand: str, *args) -> List[str]:
+    """Build the argument list for running a subcommand of the executable."""
+    return [_EXECUTABLE_STR, subcommand, *map(str, args)]
+
+
+def _dispatch(subcommand: str, *args) -> Dict:
+    """Run a subcommand of the executable with the given arguments."""
+    return _run_command(_build_command(subcommand, *args))
 
 
 def run_bipartite_matching(
@@ -84,16 +138,7 @@ def run_bipartite_matching(
     Returns:
         Dictionary containing the JSON output from the algorithm
     """
-    executable_path = _get_executable_path()
-    command = [
-        str(executable_path),
-        "bipartite",
-        str(n),
-        str(p),
-        str(seed),
-        str(time_limit),
-    ]
-    return _run_command(command)
+    return _dispatch("bipartite", n, p, seed, time_limit)
 
 
 def run_3d_matching(n: int, p: float, seed: int = 42, time_limit: int = 10) -> Dict:
@@ -109,16 +154,7 @@ def run_3d_matching(n: int, p: float, seed: int = 42, time_limit: int = 10) -> D
     Returns:
         Dictionary containing the JSON output from the algorithm
     """
-    executable_path = _get_executable_path()
-    command = [
-        str(executable_path),
-        "3dmatching",
-        str(n),
-        str(p),
-        str(seed),
-        str(time_limit),
-    ]
-    return _run_command(command)
+    return _dispatch("3dmatching", n, p, seed, time_limit)
 
 
 def run_hamiltonian(
@@ -141,14 +177,159 @@ def run_hamiltonian(
     Returns:
         Dictionary containing the JSON output from the algorithm
     """
-    executable_path = _get_executable_path()
-    command = [
-        str(executable_path),
-        "hamiltonian",
-        str(n),
-        str(p),
-        str(min_hamiltonian_path_length),
-        str(seed),
-        str(time_limit),
-    ]
-    return _run_command(command)
+    return _dispatch(
+        "hamiltonian", n, p, min_hamiltonian_path_length, seed, time_limit
+    )
+
+
+def run_batch(
+    run_func: Callable[..., Dict],
+    params_list: List[Dict],
+    max_workers: Optional[int] = None,
+) -> List[Dict]:
+    """
+    Run several experiments in parallel.
+
+    Each experiment is a separate process, so the worker threads only wait
+    on their child while the algorithms use all available cores.
+
+    Args:
+        run_func: One of the run_* functions above
+        params_list: Keyword arguments for each call of run_func
+        max_workers: Maximum number of concurrent experiments
+            (default: number of CPUs)
+
+    Returns:
+        List of JSON outputs, in the same order as params_list
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = [executor.submit(run_func, **params) for params in params_list]
+        return [future.result() for future in futures]
+    except BaseException:
+        # Don't start the queued experiments after an error or interrupt
+        executor.shutdown(wait=True, cancel_futures=True)
+        raise
+    finally:
+        executor.shutdown(wait=True)
+
+
+class PersistentMatroidWorker:
+    """
+    Keep one executable process alive and run experiments through it.
+
+    Avoids starting a new process for every experiment, which matters when
+    running many short experiments (small n or time_limit) in a row. A worker
+    runs one experiment at a time; use one worker per thread for parallelism.
+
+    Example:
+        with PersistentMatroidWorker() as worker:
+            res = worker.run("bipartite", 100, 0.02, 42, 10)
+    """
+
+    def __init__(self):
+        self._process = None
+
+    def __enter__(self) -> "PersistentMatroidWorker":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _start(self) -> None:
+        _check_executable(_EXECUTABLE_STR)
+        # See _run_command about stderr and close_fds
+        self._process = subprocess.Popen(
+            [_EXECUTABLE_STR, "serve"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            close_fds=False,
+        )
+
+    def close(self) -> None:
+        """Stop the worker process. The next run() starts a new one."""
+        if self._process is None:
+            return
+        try:
+            self._process.stdin.close()
+        except BrokenPipeError:
+            pass  # The worker already exited
+        self._process.wait()
+        self._process.stdout.close()
+        self._process = None
+
+    def _kill(self) -> None:
+        """Stop the worker without waiting for a running experiment."""
+        if self._process is not None:
+            self._process.kill()
+        self.close()
+
+    def run(self, subcommand: str, *args) -> Dict:
+        """
+        Run one experiment.
+
+        Args:
+            subcommand: Executable subcommand ("bipartite", "3dmatching",
+                "hamiltonian")
+            *args: Subcommand arguments, in command line order
+
+        Returns:
+            Dictionary containing the JSON output from the algorithm
+
+        Raises:
+            FileNotFoundError: If executable doesn't exist
+            RuntimeError: If the experiment fails or the worker exits
+            ValueError: If an argument is empty or contains whitespace, or if
+                output is invalid JSON
+        """
+        # Requests are whitespace-separated on a single line, so an empty or
+        # whitespace-containing argument would change the number of requests
+        # or arguments the worker sees
+        request_args = _build_command(subcommand, *args)[1:]
+        for arg in request_args:
+            if arg.split() != [arg]:
+                raise ValueError(
+                    f"Invalid argument {arg!r}: must be non-empty without whitespace"
+                )
+
+        if self._process is None:
+            self._start()
+
+        request = " ".join(request_args) + "\n"
+        try:
+            self._process.stdin.write(request.encode())
+            self._process.stdin.flush()
+            line = self._process.stdout.readline()
+        except BrokenPipeError:
+            line = b""
+        except BaseException:
+            # Interrupted (e.g. KeyboardInterrupt) before the reply arrived.
+            # The worker would still send it later and it would be taken as
+            # the reply to the next request, so start over instead.
+            self._kill()
+            raise
+
+        if not line:
+            # The worker died; start a fresh one on the next call
+            self._kill()
+            raise RuntimeError(
+                "Worker process exited unexpectedly.\n"
+                "Check stderr output above for details."
+            )
+
+        try:
+            result = _parse_json(line)
+        except ValueError as e:
+            self._kill()
+            raise ValueError(
+                "Failed to parse JSON output.\n"
+                f"Stdout: {line[:200].decode(errors='replace')}\n"
+                f"JSON Error: {e}"
+            ) from e
+
+        if "error" in result:
+            raise RuntimeError(f"Command failed: {result['error']}")
+        return result
@@ -7,6 +7,8 @@
 #include <memory>
 #include <nlohmann/json.hpp>
 #include <set>
+#include <sstream>
+#include <stdexcept>
 #include <string>
 #include <type_traits>
 #include <vector>
@@ -72,178 +74,214 @@ buildOutputJson(const std::string &problemName, const nlohmann::json &graphJson,
   return output;
 }
 
-// Parse command line arguments and run experiments
-int main(int argc, char *argv[]) {
-  try {
-    if (argc < 2) {
-      std::cerr << "Usage: " << argv[0] << " <command> [args...]" << std::endl;
-      std::cerr << "Commands:" << std::endl;
-      std::cerr << "  bipartite <n> <p> [seed] [timeLimit]" << std::endl;
-      std::cerr << "  3dmatching <n> <p> [seed] [timeLimit]" << std::endl;
-      std::cerr << "  hamiltonian <n> <p> [minHamiltonianPathLength] [seed] "
-                   "[timeLimit]"
-                << std::endl;
-      return 1;
+// Run a single experiment and return its JSON output.
+// args[0] is the command name, followed by its arguments.
+nlohmann::json runExperiment(const std::vector<std::string> &args) {
+  const std::string &command = args.at(0);
+
+  if (command == "bipartite" && args.size() >= 3) {
+    int n = std::stoi(args[1]);
+    double p = std::stod(args[2]);
+    unsigned int seed = (args.size() >= 4) ? std::stoul(args[3]) : 42;
+    int timeLimit = (args.size() >= 5) ? std::stoi(args[4]) : 10;
+
+    // Generate random bipartite graph
+    GraphGenerator gen(seed);
+    auto edgePairs = gen.generateErdosRenyiBipartite(n, p);
+    std::cerr << "Generated " << edgePairs.size() << " edges" << std::endl;
+
+    // Convert pairs to vectors for MatchingProblem (2-uniform hypergraph)
+    std::vector<std::vector<int>> edges;
+    edges.reserve(edgePairs.size());
+    for (const auto &pair : edgePairs) {
+      edges.push_back({pair.first, pair.second});
     }
 
-    std::string command = argv[1];
-
-    if (command == "bipartite" && argc >= 4) {
-      int n = std::stoi(argv[2]);
-      double p = std::stod(argv[3]);
-      unsigned int seed = (argc >= 5) ? std::stoul(argv[4]) : 42;
-      int timeLimit = (argc >= 6) ? std::stoi(argv[5]) : 10;
+    // Create MatchingProblem for 2-uniform hypergraph (bipartite matching)
+    auto matchingProblem = std::make_shared<MatchingProblem>(2, n, edges);
 
-      // Generate random bipartite graph
-      GraphGenerator gen(seed);
-      auto edgePairs = gen.generateErdosRenyiBipartite(n, p);
-      std::cerr << "Generated " << edgePairs.size() << " edges" << std::endl;
+    // Run baseline algorithm
+    BaselineAlgorithm baseline(matchingProblem);
+    auto baselineResult = baseline.run();
 
-      // Convert pairs to vectors for MatchingProblem (2-uniform hypergraph)
-      std::vector<std::vector<int>> edges;
-      edges.reserve(edgePairs.size());
-      for (const auto &pair : edgePairs) {
-        edges.push_back({pair.first, pair.second});
-      }
+    // Reset and run Kuhn 2D matching algorithm
+    matchingProblem->reset();
+    Kuhn2dMatchingAlgorithm kuhn(matchingProblem);
+    auto kuhnResult = kuhn.run();
 
-      // Create MatchingProblem for 2-uniform hypergraph (bipartite matching)
-      auto matchingProblem = std::make_shared<MatchingProblem>(2, n, edges);
+    // Reset and run local search algorithm
+    matchingProblem->reset();
+    LocalSearchAlgorithm localSearch(matchingProblem, timeLimit);
+    auto localSearchSolutions = localSearch.run();
 
-      // Run baseline algorithm
-      BaselineAlgorithm baseline(matchingProblem);
-      auto baselineResult = baseline.run();
-
-      // Reset and run Kuhn 2D matching algorithm
-      matchingProblem->reset();
-      Kuhn2dMatchingAlgorithm kuhn(matchingProblem);
-      auto kuhnResult = kuhn.run();
+    // Validate all solutions before outputting
+    validate_bipartite_matching(n, edgePairs, baselineResult.getSolution());
+    validate_bipartite_matching(n, edgePairs, kuhnResult.getSolution());
+    for (const auto &solution : localSearchSolutions) {
+      validate_bipartite_matching(n, edgePairs, solution.getSolution());
+    }
 
-      // Reset and run local search algorithm
-      matchingProblem->reset();
-      LocalSearchAlgorithm localSearch(matchingProblem, timeLimit);
-      auto localSearchSolutions = localSearch.run();
+    // Build JSON output using helper functions
+    auto graphJson = graphToJson(edges);
+    AlgorithmResults results{baselineResult, localSearchSolutions};
+    auto output =
+        buildOutputJson("BIPARTITE", graphJson, results, &kuhnResult);
+
+    return output;
+  } else if (command == "3dmatching" && args.size() >= 3) {
+    int n = std::stoi(args[1]);
+    double p = std::stod(args[2]);
+    unsigned int seed = (args.size() >= 4) ? std::stoul(args[3]) : 42;
+    int timeLimit = (args.size() >= 5) ? std::stoi(args[4]) : 10;
+
+    // Generate 3D matching instance using tripartite hypergraph
+    GraphGenerator gen(seed);
+    auto hyperedges = gen.generate3DGraph(n, p);
+    std::cerr << "Generated " << hyperedges.size() << " hyperedges"
+              << std::endl;
+
+    // Create MatchingProblem for 3-uniform hypergraph (3D matching)
+    auto matchingProblem =
+        std::make_shared<MatchingProblem>(3, n, hyperedges);
+
+    // Run baseline algorithm
+    BaselineAlgorithm baseline(matchingProblem);
+    auto baselineResult = baseline.run();
+
+    // Reset problem and run local search
+    matchingProblem->reset();
+    LocalSearchAlgorithm localSearch(matchingProblem, timeLimit);
+    auto localSearchResults = localSearch.run();
+
+    AlgorithmResults results{baselineResult, localSearchResults};
+
+    // Validate all solutions before outputting
+    validate_3d_matching(n, hyperedges, baselineResult.getSolution());
+    for (const auto &solution : localSearchResults) {
+      validate_3d_matching(n, hyperedges, solution.getSolution());
+    }
 
-      // Validate all solutions before outputting
-      validate_bipartite_matching(n, edgePairs, baselineResult.getSolution());
-      validate_bipartite_matching(n, edgePairs, kuhnResult.getSolution());
-      for (const auto &solution : localSearchSolutions) {
-        validate_bipartite_matching(n, edgePairs, solution.getSolution());
+    // Build JSON output using helper functions
+    auto graphJson = graphToJson(hyperedges);
+    auto output = buildOutputJson("3DMATCHING", graphJson, results);
+
+    return output;
+  } else if (command == "hamiltonian" && args.size() >= 3) {
+    int n = std::stoi(args[1]);
+    double p = std::stod(args[2]);
+
+    // Parse optional minHamiltonianPathLength, seed, and timeLimit
+    // Format: hamiltonian <n> <p> [minHamiltonianPathLength] [seed]
+    // [timeLimit]
+    int minHamiltonianPathLength = 0;
+    unsigned int seed = 42;
+    int timeLimit = 10;
+
+    if (args.size() >= 4) {
+      if (args.size() >= 5) {
+        if (args.size() >= 6) {
+          // All three optional parameters provided
+          minHamiltonianPathLength = std::stoi(args[3]);
+          seed = std::stoul(args[4]);
+          timeLimit = std::stoi(args[5]);
+        } else {
+          // minHamiltonianPathLength and seed provided
+          minHamiltonianPathLength = std::stoi(args[3]);
+          seed = std::stoul(args[4]);
+        }
+      } else {
+        // Only minHamiltonianPathLength provided (args.size() == 4)
+        minHamiltonianPathLength = std::stoi(args[3]);
       }
+    }
 
-      // Build JSON output using helper functions
-      auto graphJson = graphToJson(edges);
-      AlgorithmResults results{baselineResult, localSearchSolutions};
-      auto output =
-          buildOutputJson("BIPARTITE", graphJson, results, &kuhnResult);
-
-      std::cout << output.dump() << std::endl;
-
-    } else if (command == "3dmatching" && argc >= 4) {
-      int n = std::stoi(argv[2]);
-      double p = std::stod(argv[3]);
-      unsigned int seed = (argc >= 5) ? std::stoul(argv[4]) : 42;
-      int timeLimit = (argc >= 6) ? std::stoi(argv[5]) : 10;
-
-      // Generate 3D matching instance using tripartite hypergraph
-      GraphGenerator gen(seed);
-      auto hyperedges = gen.generate3DGraph(n, p);
-      std::cerr << "Generated " << hyperedges.size() << " hyperedges"
-                << std::endl;
-
-      // Create MatchingProblem for 3-uniform hypergraph (3D matching)
-      auto matchingProblem =
-          std::make_shared<MatchingProblem>(3, n, hyperedges);
+    // Generate random directed graph for Hamiltonian path
+    GraphGenerator gen(seed);
+    auto edges =
+        gen.generateRandomDirectedGraph(n, p, minHamiltonianPathLength);
+    std::cerr << "Generated " << edges.size() << " edges" << std::endl;
 
-      // Run baseline algorithm
-      BaselineAlgorithm baseline(matchingProblem);
-      auto baselineResult = baseline.run();
+    // Create HamiltonianPathProblem
+    auto hamiltonianProblem = std::make_shared<HamiltonianPathProblem>(
+        static_cast<int>(edges.size()), n, edges);
 
-      // Reset problem and run local search
-      matchingProblem->reset();
-      LocalSearchAlgorithm localSearch(matchingProblem, timeLimit);
-      auto localSearchResults = localSearch.run();
+    // Run baseline algorithm
+    BaselineAlgorithm baseline(hamiltonianProblem);
+    auto baselineResult = baseline.run();
 
-      AlgorithmResults results{baselineResult, localSearchResults};
+    // Reset problem and run local search
+    hamiltonianProblem->reset();
+    LocalSearchAlgorithm localSearch(hamiltonianProblem, timeLimit);
+    auto localSearchResults = localSearch.run();
 
-      // Validate all solutions before outputting
-      validate_3d_matching(n, hyperedges, baselineResult.getSolution());
-      for (const auto &solution : localSearchResults) {
-        validate_3d_matching(n, hyperedges, solution.getSolution());
-      }
+    AlgorithmResults results{baselineResult, localSearchResults};
 
-      // Build JSON output using helper functions
-      auto graphJson = graphToJson(hyperedges);
-      auto output = buildOutputJson("3DMATCHING", graphJson, results);
-
-      std::cout << output.dump() << std::endl;
-
-    } else if (command == "hamiltonian" && argc >= 4) {
-      int n = std::stoi(argv[2]);
-      double p = std::stod(argv[3]);
-
-      // Parse optional minHamiltonianPathLength, seed, and timeLimit
-      // Format: hamiltonian <n> <p> [minHamiltonianPathLength] [seed]
-      // [timeLimit]
-      int minHamiltonianPathLength = 0;
-      unsigned int seed = 42;
-      int timeLimit = 10;
-
-      if (argc >= 5) {
-        if (argc >= 6) {
-          if (argc >= 7) {
-            // All three optional parameters provided
-            minHamiltonianPathLength = std::stoi(argv[4]);
-            seed = std::stoul(argv[5]);
-            timeLimit = std::stoi(argv[6]);
-          } else {
-            // minHamiltonianPathLength and seed provided
-            minHamiltonianPathLength = std::stoi(argv[4]);
-            seed = std::stoul(argv[5]);
-          }
-        } else {
-          // Only minHamiltonianPathLength provided (argc == 5)
-          minHamiltonianPathLength = std::stoi(argv[4]);
-        }
-      }
-
-      // Generate random directed graph for Hamiltonian path
-      GraphGenerator gen(seed);
-      auto edges =
-          gen.generateRandomDirectedGraph(n, p, minHamiltonianPathLength);
-      std::cerr << "Generated " << edges.size() << " edges" << std::endl;
-
-      // Create HamiltonianPathProblem
-      auto hamiltonianProblem = std::make_shared<HamiltonianPathProblem>(
-          static_cast<int>(edges.size()), n, edges);
+    // Validate all solutions before outputting
+    validate_hamiltonian_path(n, edges, baselineResult.getSolution());
+    for (const auto &solution : localSearchResults) {
+      validate_hamiltonian_path(n, edges, solution.getSolution());
+    }
 
-      // Run baseline algorithm
-      BaselineAlgorithm baseline(hamiltonianProblem);
-      auto baselineResult = baseline.run();
+    // Build JSON output using helper functions
+    auto graphJson = graphToJson(edges);
+    auto output = buildOutputJson("HAMILTONIAN", graphJson, results);
 
-      // Reset problem and run local search
-      hamiltonianProblem->reset();
-      LocalSearchAlgorithm localSearch(hamiltonianProblem, timeLimit);
-      auto localSearchResults = localSearch.run();
+    return output;
+  }
 
-      AlgorithmResults results{baselineResult, localSearchResults};
+  throw std::invalid_argument("Invalid command or arguments");
+}
 
-      // Validate all solutions before outputting
-      validate_hamiltonian_path(n, edges, baselineResult.getSolution());
-      for (const auto &solution : localSearchResults) {
-        validate_hamiltonian_path(n, edges, solution.getSolution());
+// Serve experiments over stdin/stdout: each input line holds the arguments
+// of one experiment (same as on the command line), and each output line
+// holds its JSON result, or {"error": ...} if it failed.
+void serve() {
+  std::string line;
+  while (std::getline(std::cin, line)) {
+    std::istringstream lineStream(line);
+    std::vector<std::string> args;
+    std::string arg;
+    while (lineStream >> arg) {
+      args.push_back(arg);
+    }
+    nlohmann::json output;
+    try {
+      if (args.empty()) {
+        throw std::invalid_argument("empty command");
       }
+      output = runExperiment(args);
+    } catch (const std::exception &e) {
+      std::cerr << "Error: " << e.what() << std::endl;
+      output = {{"error", e.what()}};
+    }
+    std::cout << output.dump() << std::endl;
+  }
+}
 
-      // Build JSON output using helper functions
-      auto graphJson = graphToJson(edges);
-      auto output = buildOutputJson("HAMILTONIAN", graphJson, results);
+// Parse command line arguments and run experiments
+int main(int argc, char *argv[]) {
+  try {
+    if (argc < 2) {
+      std::cerr << "Usage: " << argv[0] << " <command> [args...]" << std::endl;
+      std::cerr << "Commands:" << std::endl;
+      std::cerr << "  bipartite <n> <p> [seed] [timeLimit]" << std::endl;
+      std::cerr << "  3dmatching <n> <p> [seed] [timeLimit]" << std::endl;
+      std::cerr << "  hamiltonian <n> <p> [minHamiltonianPathLength] [seed] "
+                   "[timeLimit]"
+                << std::endl;
+      std::cerr << "  serve (read one command per line from stdin)"
+                << std::endl;
+      return 1;
+    }
 
-      std::cout << output.dump() << std::endl;
+    std::vector<std::string> args(argv + 1, argv + argc);
 
-    } else {
-      std::cerr << "Invalid command or arguments" << std::endl;
-      return 1;
+    if (args[0] == "serve") {
+      serve();
+      return 0;
     }
 
+    std::cout << runExperiment(args).dump() << std::endl;
     return 0;
   } catch (const std::exception &e) {
     std::cerr << "Error: " << e.what() << std::endl;